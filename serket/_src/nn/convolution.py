@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import abc
 import functools as ft
-import operator as op
+import math
 from itertools import product
 from typing import Sequence
 
@@ -478,36 +478,113 @@ def depthwise_conv_nd(
     return jnp.squeeze(x, 0) if bias is None else jnp.squeeze(x + bias, 0)
 
 
+@ft.lru_cache(maxsize=None)
+def generate_modes_slices(modes: tuple[int, ...]) -> tuple[tuple[slice, ...], ...]:
+    """Generate the slices of the fourier modes corners of the rfft spectrum."""
+    *ms, ml = modes
+    slices_ = [[slice(None, ml)]]
+    slices_ += [[slice(None, mode), slice(-mode, None)] for mode in reversed(ms)]
+    return tuple((slice(None), *reversed(i)) for i in product(*slices_))
+
+
 def spectral_conv_nd(
     input: Annotated[jax.Array, "I..."],
     weight: Weight,
     modes: Sequence[int],
+    mask: Weight | None = None,
 ) -> Annotated[jax.Array, "O..."]:
     """fourier neural operator convolution function.
 
     Args:
         input: input array. shape is ``(in_features, spatial size)``.
-        weight: real and complex convolutional kernel. shape is ``(2 , 2 ** (dim-1), out_features, in_features, modes)``.
-            where dim is the number of spatial dimensions on the
+        weight: complex convolutional kernel. shape is ``(2 ** (dim-1), out_features, in_features, modes)``.
+            where dim is the number of spatial dimensions of the input. alternatively,
+            a real kernel holding the real and imaginary parts stacked along the
+            first axis. shape is ``(2, 2 ** (dim-1), out_features, in_features, modes)``.
         modes: number of modes included in the fft representation of the input.
+            accepts a sequence of integers, one for each spatial dimension. the
+            function is compiled once for each ``modes`` and input shape.
+        mask: a binary mask multiplied with the complex kernel. shape is
+            ``(2 ** (dim-1), out_features, in_features, modes)``. set to ``None``
+            to not use a mask.
     """
+    # static arguments of the jitted kernel must be hashable
+    return _spectral_conv_nd(input, weight, tuple(modes), mask)
 
-    def generate_modes_slices(modes: Sequence[int]):
-        *ms, ml = modes
-        slices_ = [[slice(None, ml)]]
-        slices_ += [[slice(None, mode), slice(-mode, None)] for mode in reversed(ms)]
-        return [[slice(None)] + list(reversed(i)) for i in product(*slices_)]
 
+@ft.partial(jax.jit, inline=True, static_argnames="modes")
+def _spectral_conv_nd(
+    input: Annotated[jax.Array, "I..."],
+    weight: Weight,
+    modes: tuple[int, ...],
+    mask: Weight | None,
+) -> Annotated[jax.Array, "O..."]:
     _, *si, sl = input.shape
-    weight_r, weight_i = jnp.split(weight, 2, axis=0)
-    weight = weight_r + 1j * weight_i
-    _, o, *_ = weight.shape
-    x_fft = jnp.fft.rfftn(input, s=(*si, sl))
-    out = jnp.zeros([o, *si, sl // 2 + 1], dtype=input.dtype) + 0j
-    for i, slice_i in enumerate(generate_modes_slices(modes)):
-        matmul_out = jnp.einsum("i...,oi...->o...", x_fft[tuple(slice_i)], weight[i])
-        out = out.at[tuple(slice_i)].set(matmul_out)
-    return jnp.fft.irfftn(out, s=(*si, sl))
+    *ms, ml = modes
+    # the real fft keeps only the non-negative frequencies of the last axis
+    if ml > sl // 2 + 1 or any(mi > sz for mi, sz in zip(ms, si)):
+        raise ValueError(
+            f"{modes=} exceeds the rfft spectrum size {(*si, sl // 2 + 1)} "
+            f"of the input with spatial shape {(*si, sl)}."
+        )
+    # one kernel per corner of the spectrum, for both the matmul and the
+    # broadcast paths below
+    if (corners := weight.shape[-len(modes) - 3]) != 2 ** (len(modes) - 1):
+        raise ValueError(
+            f"weight has {corners} corners, expected {2 ** (len(modes) - 1)} "
+            f"for {len(modes)} spatial dimensions. got {weight.shape=}."
+        )
+    # fft is only defined for float32/float64 inputs, 16-bit inputs and kernels
+    # are upcast to float32 and the output is cast back to the input dtype.
+    # integer inputs return the promoted floating dtype.
+    dtype = jnp.promote_types(input.dtype, jnp.float32)
+    out_dtype = input.dtype if jnp.issubdtype(input.dtype, jnp.floating) else dtype
+    input = input.astype(dtype)
+    if not jnp.iscomplexobj(weight):
+        weight = weight.astype(jnp.promote_types(weight.dtype, jnp.float32))
+        weight = jax.lax.complex(weight[0], weight[1])
+    weight = weight if mask is None else weight * mask
+    # single batched fft over the spatial axes of all input features
+    axes = tuple(range(1, input.ndim))
+    x_fft = jnp.fft.rfftn(input, s=(*si, sl), axes=axes)
+    slices = generate_modes_slices(modes)
+    x_modes = jnp.stack([x_fft[slice_i] for slice_i in slices])
+    cdtype = jnp.result_type(weight, x_modes)
+    weight, x_modes = weight.astype(cdtype), x_modes.astype(cdtype)
+    _, o, i, *_ = weight.shape
+
+    if i == 1 or o == 1:
+        # a single input or output feature does not need a matmul
+        out = jnp.sum(weight * jnp.expand_dims(x_modes, 1), axis=2)
+    else:
+        # batch over the corner and mode axes and contract the input features
+        batch = (0, *range(2, x_modes.ndim))
+        dimension_numbers = (((2,), (1,)), ((0, *range(3, weight.ndim)), batch))
+        out = jax.lax.dot_general(
+            weight,
+            x_modes,
+            dimension_numbers=dimension_numbers,
+            preferred_element_type=cdtype,
+        )
+        # (corners, *modes, out_features) -> (corners, out_features, *modes)
+        out = jnp.moveaxis(out, -1, 1)
+
+    # assemble the truncated spectrum instead of scattering the corners into
+    # a full size zero spectrum. the leading corner axes are ordered from the
+    # last to the first spatial axis, each is merged by placing the low and high
+    # modes at both ends of its spatial axis. the padding of the last axis is
+    # left to `irfftn`.
+    out = out.reshape(*(2,) * len(ms), *out.shape[1:])
+    for axis in reversed(range(len(ms))):
+        low, high = out
+        pos, size, mode = 2 * axis + 1, si[axis], ms[axis]
+        # for overlapping modes the high modes take precedence
+        low = jax.lax.slice_in_dim(low, 0, min(mode, size - mode), axis=pos)
+        zeros_shape = list(low.shape)
+        zeros_shape[pos] = max(size - 2 * mode, 0)
+        zeros = jnp.zeros(zeros_shape, dtype=out.dtype)
+        out = jnp.concatenate([low, zeros, high], axis=pos)
+    return jnp.fft.irfftn(out, s=(*si, sl), axes=axes).astype(out_dtype)
 
 
 def local_conv_nd(
@@ -524,8 +601,11 @@ def local_conv_nd(
 
     Args:
         input: input array. shape is ``(in_features, spatial)``.
-        weight: convolutional kernel. shape is ``(out_features, in_features, kernel)``.
-        bias: bias. shape is ``(out_features, spatial)``. set to ``None`` to not use a bias.
+        weight: convolutional kernel. shape is
+            ``(out_features, in_features * prod(kernel_size), *out_size)``. the
+            kernel of each output location is contracted with the patch extracted
+            at that location in a single ``dot_general`` batched over ``out_size``.
+        bias: bias. shape is ``(out_features, *out_size)``. set to ``None`` to not use a bias.
         strides: stride of the convolution accepts tuple of integers for different
          strides in each dimension.
         padding: padding of the input before convolution accepts tuple of integers
@@ -535,7 +615,8 @@ def local_conv_nd(
         kernel_size: size of the convolutional kernel accepts tuple of integers for
             different kernel sizes in each dimension.
         mask: a binary mask multiplied with the convolutional kernel. shape is
-            ``(out_features, in_features, kernel)``. set to ``None`` to not use a mask.
+            ``(out_features, in_features * prod(kernel_size), *out_size)``. set to
+            ``None`` to not use a mask.
     """
     x = jax.lax.conv_general_dilated_local(
         lhs=jnp.expand_dims(input, 0),
@@ -546,12 +627,14 @@ def local_conv_nd(
         rhs_dilation=dilation,
         dimension_numbers=generate_conv_dim_numbers(input.ndim - 1),
     )
-
-    return jnp.squeeze(x + bias, 0) if bias is not None else jnp.squeeze(x, 0)
+    x = jnp.squeeze(x, 0)
+    # bias matches the output shape, so the add needs no broadcast and is fused
+    # with the relayout of the matmul output under `jit`
+    return x if bias is None else x + bias
 
 
 def is_lazy_call(instance, *_1, **_2) -> bool:
-    return getattr(instance, "in_features", False) is None
+    return instance.in_features is None
 
 
 def is_lazy_init(_1, in_features, *_2, **_3) -> bool:
@@ -2925,20 +3008,36 @@ class SpectralConvND(TreeClass):
         self.in_features = validate_pos_int(in_features)
         self.out_features = validate_pos_int(out_features)
         self.modes: tuple[int, ...] = canonicalize(modes, self.spatial_ndim, "modes")
-        weight_shape = (1, out_features, in_features, *self.modes)
+        # one kernel per corner of the retained fourier modes
+        corners = 2 ** (self.spatial_ndim - 1)
+        weight_shape = (corners, out_features, in_features, *self.modes)
         scale = 1 / (in_features * out_features)
         k1, k2 = jr.split(key)
-        self.weight_r = scale * jr.normal(k1, weight_shape).astype(dtype)
-        self.weight_i = scale * jr.normal(k2, weight_shape).astype(dtype)
+        weight_r = scale * jr.normal(k1, weight_shape).astype(dtype)
+        weight_i = scale * jr.normal(k2, weight_shape).astype(dtype)
+        # store real and imaginary parts in a single buffer
+        self.weight = jnp.stack([weight_r, weight_i], axis=0)
 
     @ft.partial(maybe_lazy_call, is_lazy=is_lazy_call, updates=updates)
     @ft.partial(validate_spatial_ndim, argnum=0)
     @ft.partial(validate_in_features_shape, axis=0)
-    def __call__(self, input: jax.Array) -> jax.Array:
+    def __call__(self, input: jax.Array, mask: Weight | None = None) -> jax.Array:
+        """Apply the layer.
+
+        Args:
+            input: input array. shape is ``(in_features, spatial size)``. spatial size
+                is length for 1D convolution, height, width for 2D convolution and
+                height, width, depth for 3D convolution.
+            mask: a binary mask multiplied with the complex kernel, e.g. to prune
+                small magnitude modes. shape is
+                ``(2 ** (spatial_ndim - 1), out_features, in_features, *modes)``.
+                set to ``None`` to not use a mask.
+        """
         return self.conv_op(
             input=input,
-            weight=jnp.concatenate([self.weight_r, self.weight_i], axis=0),
+            weight=self.weight,
             modes=self.modes,
+            mask=mask,
         )
 
     spatial_ndim = property(abc.abstractmethod(lambda _: ...))
@@ -2958,10 +3057,14 @@ class SpectralConv1D(SpectralConvND):
             output channels, for 3D convolution this is the number of output
             channels.
 
-        modes: Number of modes to use in the spectral convolution.
+        modes: Number of modes to use in the spectral convolution. must be less
+            than or equal to ``length // 2 + 1`` as the input is transformed with a
+            real fft.
 
         key: key to use for initializing the weights.
-        dtype: dtype of the weights. defaults to ``float32``
+        dtype: dtype of the weights. defaults to ``float32``. 16-bit dtypes
+            (e.g. ``bfloat16``) halve the weights memory, the weights are upcast
+            to ``float32`` for the fft and the spectral multiply.
 
 
     Example:
@@ -3017,10 +3120,14 @@ class SpectralConv2D(SpectralConvND):
 
         modes: Number of modes to use in the spectral convolution. accepts two
             integer tuple for different modes in each dimension. or a single
-            integer for the same number of modes in each dimension.
+            integer for the same number of modes in each dimension. the modes of
+            the last dimension must be less than or equal to ``size // 2 + 1`` as
+            the input is transformed with a real fft.
 
         key: key to use for initializing the weights.
-        dtype: dtype of the weights. defaults to ``float32``
+        dtype: dtype of the weights. defaults to ``float32``. 16-bit dtypes
+            (e.g. ``bfloat16``) halve the weights memory, the weights are upcast
+            to ``float32`` for the fft and the spectral multiply.
 
     Example:
         >>> import jax.numpy as jnp
@@ -3075,10 +3182,14 @@ class SpectralConv3D(SpectralConvND):
 
         modes: Number of modes to use in the spectral convolution. accepts three
             integer tuple for different modes in each dimension. or a single
-            integer for the same number of modes in each dimension.
+            integer for the same number of modes in each dimension. the modes of
+            the last dimension must be less than or equal to ``size // 2 + 1`` as
+            the input is transformed with a real fft.
 
         key: key to use for initializing the weights.
-        dtype: dtype of the weights. defaults to ``float32``
+        dtype: dtype of the weights. defaults to ``float32``. 16-bit dtypes
+            (e.g. ``bfloat16``) halve the weights memory, the weights are upcast
+            to ``float32`` for the fft and the spectral multiply.
 
     Example:
         >>> import jax.numpy as jnp
@@ -3119,11 +3230,9 @@ class SpectralConv3D(SpectralConvND):
 
 
 def is_lazy_call(instance, *_, **__) -> bool:
-    in_features = getattr(instance, "in_features", False)
-    in_size = getattr(instance, "in_size", False)
-    # either in_features or in_size must is None then
-    # mark the layer as lazy at call time
-    return in_features is None or in_size is None
+    # `in_features` and `in_size` are set in both the lazy and the materialized
+    # layer. either is None then mark the layer as lazy at call time
+    return instance.in_features is None or instance.in_size is None
 
 
 def is_lazy_init(_, in_features, *__, **k) -> bool:
@@ -3135,17 +3244,15 @@ def is_lazy_init(_, in_features, *__, **k) -> bool:
 def infer_in_features(instance, x, *__, **___) -> int:
     # in case `in_features` is None, infer it from the input shape
     # otherwise return the `in_features` attribute
-    if getattr(instance, "in_features", False) is None:
-        return x.shape[0]
-    return instance.in_features
+    in_features = instance.in_features
+    return x.shape[0] if in_features is None else in_features
 
 
 def infer_in_size(instance, x, *__, **___) -> tuple[int, ...]:
     # in case `in_size` is None, infer it from the input shape
     # otherwise return the `in_size` attribute
-    if getattr(instance, "in_size", False) is None:
-        return x.shape[1:]
-    return instance.in_size
+    in_size = instance.in_size
+    return x.shape[1:] if in_size is None else in_size
 
 
 updates = dict(in_features=infer_in_features, in_size=infer_in_size)
@@ -3195,7 +3302,7 @@ class ConvNDLocal(TreeClass):
         # OIH...
         weight_shape = (
             self.out_features,
-            self.in_features * ft.reduce(op.mul, self.kernel_size),
+            self.in_features * math.prod(self.kernel_size),
             *out_size,
         )
 
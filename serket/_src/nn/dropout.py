@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import abc
 import functools as ft
-from itertools import chain
+import math
 
 import jax
 import jax.numpy as jnp
@@ -26,7 +26,6 @@ from serket import TreeClass, autoinit, field
 from serket._src.custom_transform import tree_eval
 from serket._src.nn.linear import Identity
 from serket._src.utils.convert import canonicalize
-from serket._src.utils.mapping import kernel_map
 from serket._src.utils.validate import (
     IsInstance,
     Range,
@@ -47,19 +46,31 @@ def dropout_nd(
         key: random number generator key
         input: input array
         drop_rate: probability of an element to be zeroed.
-        drop_axes: axes to apply dropout. Default: None to apply to all axes.
+        drop_axes: tuple of axes to apply dropout. Default: None to apply to all axes.
     """
+    # static arguments of the jitted kernel must be hashable
+    drop_axes = None if drop_axes is None else tuple(drop_axes)
+    return _dropout_nd(key, input, drop_rate, drop_axes)
+
+
+@ft.partial(jax.jit, inline=True, static_argnames="drop_axes")
+def _dropout_nd(
+    key: jax.Array,
+    input: jax.Array,
+    drop_rate: float,
+    drop_axes: tuple[int, ...] | None,
+) -> jax.Array:
     shape = (
         input.shape
         if drop_axes is None
         else (input.shape[i] if i in drop_axes else 1 for i in range(input.ndim))
     )
 
-    return jnp.where(
-        (keep_prop := (1 - drop_rate)) == 0.0,
-        jnp.zeros_like(input),
-        jnp.where(jr.bernoulli(key, keep_prop, shape=shape), input / keep_prop, 0),
-    )
+    keep_prop = 1 - drop_rate
+    # bernoulli samples are all `False` for zero `keep_prop`, so only the
+    # scale is guarded against division by zero
+    scale = 1 / jnp.where(keep_prop == 0.0, 1.0, keep_prop)
+    return jnp.where(jr.bernoulli(key, keep_prop, shape=shape), input * scale, 0)
 
 
 def random_cutout_nd(
@@ -78,34 +89,37 @@ def random_cutout_nd(
         cutout_count: number of holes.
         fill_value: fill_value to fill.
     """
-    start_indices = [0] * len(shape)
-    slice_sizes = [di - (di % ki) for di, ki in zip(input.shape, shape)]
-    valid_array = jax.lax.dynamic_slice(input, start_indices, slice_sizes)
-
-    @ft.partial(
-        kernel_map,
-        shape=input.shape,
-        kernel_size=shape,
-        strides=shape,
-        padding=((0, 0),) * len(shape),
-    )
-    def generate_patches(input):
-        return input
+    # static arguments of the jitted kernel must be hashable
+    return _random_cutout_nd(key, input, tuple(shape), cutout_count, fill_value)
+
+
+@ft.partial(jax.jit, inline=True, static_argnames=("shape", "cutout_count"))
+def _random_cutout_nd(
+    key: jax.Array,
+    input: jax.Array,
+    shape: tuple[int, ...],
+    cutout_count: int,
+    fill_value: int | float,
+):
+    # the input is divided into a grid of non-overlapping patches of `shape`
+    # and `cutout_count` distinct patches are filled with `fill_value`
+    grid = tuple(di // ki for di, ki in zip(input.shape, shape))
+    indices = jr.choice(key, math.prod(grid), shape=(cutout_count,), replace=False)
+    coords = jnp.unravel_index(indices, grid)
 
-    # get non-overlapping patches
-    patches = generate_patches(input)
-    patches_shape = patches.shape
+    # build the mask of the selected patches by broadcasting the patch membership
+    # along each axis, i.e. a (cutout_count, *input.shape) mask reduced over cutouts
+    coord_shape = (cutout_count,) + (1,) * input.ndim
+    mask = jnp.ones(coord_shape, dtype=bool)
 
-    # patches_shape = (patch_0, ..., patch_n, k0, ..., kn)
-    patches = patches.reshape(-1, *shape)
-    indices = jr.choice(key, patches.shape[0], shape=(cutout_count,), replace=False)
-    patches = patches.at[indices].set(fill_value).reshape(patches_shape)
-    # patches_shape = (patch_0, k0, ..., patch_n, kn)
-    patch_axes = range(len(shape))
-    kernel_axes = range(len(shape), len(shape) * 2)
-    transpose_axes = list(chain.from_iterable(zip(patch_axes, kernel_axes)))
-    depatched = patches.transpose(transpose_axes).reshape(valid_array.shape)
-    return jax.lax.dynamic_update_slice(input, depatched, start_indices)
+    for axis, (di, ki, ci) in enumerate(zip(input.shape, shape, coords)):
+        # iota is generated directly in its broadcast shape
+        iota_shape = tuple(di if i == axis else 1 for i in range(input.ndim))
+        iota = jax.lax.broadcasted_iota(ci.dtype, (1, *iota_shape), axis + 1)
+        mask = mask & ((iota // ki) == ci.reshape(coord_shape))
+
+    mask = jnp.any(mask, axis=0)
+    return jnp.where(mask, jnp.asarray(fill_value).astype(input.dtype), input)
 
 
 @autoinit
@@ -140,6 +154,18 @@ class Dropout(TreeClass):
         >>> model = Model(rate=0.5)
         >>> sk.tree_eval(model)
         Model(dropout=Identity())
+
+    Note:
+        :class:`.Dropout` accepts inputs of any shape. For batched inputs, pass
+        the whole batch with a single key instead of using ``jax.vmap`` with
+        split keys, to draw the mask in one ``bernoulli`` call.
+
+        >>> import serket as sk
+        >>> import jax.numpy as jnp
+        >>> import jax.random as jr
+        >>> layer = sk.nn.Dropout(0.5)
+        >>> batch = jnp.ones((8, 10))
+        >>> output = layer(batch, key=jr.key(0))
     """
 
     drop_rate: float = field(
@@ -365,6 +391,21 @@ class RandomCutout2D(RandomCutoutND):
         >>> key = jr.key(0)
         >>> output = layer(input, key=key)
 
+    Note:
+        :class:`.RandomCutout2D` accepts unbatched inputs. For batched inputs,
+        use ``jax.vmap`` with a key per example to draw independent cutouts.
+
+        >>> import serket as sk
+        >>> import jax
+        >>> import jax.numpy as jnp
+        >>> import jax.random as jr
+        >>> layer = sk.nn.RandomCutout2D(shape=(3,2), cutout_count=2)
+        >>> batch = jnp.ones((8, 1, 10, 10))
+        >>> keys = jr.split(jr.key(0), 8)
+        >>> output = jax.vmap(lambda x, k: layer(x, key=k))(batch, keys)
+        >>> output.shape
+        (8, 1, 10, 10)
+
     Reference:
         - https://arxiv.org/abs/1708.04552
         - https://keras.io/api/keras_cv/layers/preprocessing/random_cutout/
@@ -402,8 +443,12 @@ class RandomCutout3D(RandomCutoutND):
     spatial_ndim: int = 3
 
 
+# identity is stateless, so one instance is shared by all evaluated layers
+eval_identity = Identity()
+
+
 @tree_eval.def_eval(RandomCutoutND)
 @tree_eval.def_eval(DropoutND)
 @tree_eval.def_eval(Dropout)
 def _(_) -> Identity:
-    return Identity()
+    return eval_identity
@@ -13,42 +13,45 @@
 # limitations under the License.
 from __future__ import annotations
 
+import functools as ft
 from collections.abc import Callable as ABCCallable
-from typing import Callable, get_args
+from typing import Callable
 
-import jax
 import jax.nn.initializers as ji
 import jax.numpy as jnp
 import jax.tree_util as jtu
 
-from serket._src.utils.typing import InitFuncType, InitLiteral, InitType
-
-inits: list[InitType] = [
-    ji.he_normal(in_axis=1, out_axis=0),
-    ji.he_uniform(in_axis=1, out_axis=0),
-    ji.glorot_normal(in_axis=1, out_axis=0),
-    ji.glorot_uniform(in_axis=1, out_axis=0),
-    ji.lecun_normal(in_axis=1, out_axis=0),
-    ji.lecun_uniform(in_axis=1, out_axis=0),
-    ji.normal(),
-    ji.uniform(),
-    ji.ones,
-    ji.zeros,
-    ji.xavier_normal(in_axis=1, out_axis=0),
-    ji.xavier_uniform(in_axis=1, out_axis=0),
-    ji.orthogonal(),
-]
-
-
-init_map: dict[str, Callable[..., InitType]] = dict(zip(get_args(InitLiteral), inits))
+from serket._src.utils.typing import InitFuncType, InitType
+
+init_map: dict[str, Callable[[], InitType]] = dict(
+    he_normal=lambda: ji.he_normal(in_axis=1, out_axis=0),
+    he_uniform=lambda: ji.he_uniform(in_axis=1, out_axis=0),
+    glorot_normal=lambda: ji.glorot_normal(in_axis=1, out_axis=0),
+    glorot_uniform=lambda: ji.glorot_uniform(in_axis=1, out_axis=0),
+    lecun_normal=lambda: ji.lecun_normal(in_axis=1, out_axis=0),
+    lecun_uniform=lambda: ji.lecun_uniform(in_axis=1, out_axis=0),
+    normal=lambda: ji.normal(),
+    uniform=lambda: ji.uniform(),
+    ones=lambda: ji.ones,
+    zeros=lambda: ji.zeros,
+    xavier_normal=lambda: ji.xavier_normal(in_axis=1, out_axis=0),
+    xavier_uniform=lambda: ji.xavier_uniform(in_axis=1, out_axis=0),
+    orthogonal=lambda: ji.orthogonal(),
+)
+
+
+@ft.lru_cache(maxsize=None)
+def resolve_init_str(init: str) -> jtu.Partial[InitFuncType]:
+    # initializers are stateless, so a single instance per name is shared
+    try:
+        return jtu.Partial(init_map[init]())
+    except KeyError:
+        raise ValueError(f"Unknown {init=}, available init: {list(init_map)}")
 
 
 def resolve_init(init) -> jtu.Partial[InitFuncType]:
     if isinstance(init, str):
-        try:
-            return jtu.Partial(jax.tree_map(lambda x: x, init_map[init]))
-        except KeyError:
-            raise ValueError(f"Unknown {init=}, available init: {list(init_map)}")
+        return resolve_init_str(init)
     if init is None:
         return jtu.Partial(lambda key, shape, dtype=None: None)
     if isinstance(init, ABCCallable):
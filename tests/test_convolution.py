@@ -1355,82 +1355,75 @@ def test_conv_keras(
 
 def test_spectral_conv_1d():
     layer = sk.nn.SpectralConv1D(1, 2, modes=10, key=jax.random.key(0))
-    layer = (
-        layer.at["weight_r"]
-        .set(
-            jnp.array(
+    w_r = jnp.array(
+        [
+            [
                 [
                     [
-                        [
-                            [
-                                0.2481,
-                                0.0442,
-                                0.1537,
-                                0.2450,
-                                0.2278,
-                                0.1744,
-                                0.0112,
-                                0.1469,
-                                0.3488,
-                                0.0805,
-                            ]
-                        ],
-                        [
-                            [
-                                0.3408,
-                                0.1985,
-                                0.2097,
-                                0.4764,
-                                0.0926,
-                                0.1526,
-                                0.0880,
-                                0.0753,
-                                0.1041,
-                                0.3616,
-                            ]
-                        ],
+                        0.2481,
+                        0.0442,
+                        0.1537,
+                        0.2450,
+                        0.2278,
+                        0.1744,
+                        0.0112,
+                        0.1469,
+                        0.3488,
+                        0.0805,
                     ]
-                ]
-            )
-        )
-        .at["weight_i"]
-        .set(
-            jnp.array(
+                ],
                 [
                     [
-                        [
-                            [
-                                0.3841,
-                                0.0660,
-                                0.3170,
-                                0.4482,
-                                0.3162,
-                                0.2009,
-                                0.0844,
-                                0.2593,
-                                0.4000,
-                                0.1411,
-                            ]
-                        ],
-                        [
-                            [
-                                0.4576,
-                                0.4371,
-                                0.2765,
-                                0.0181,
-                                0.1867,
-                                0.4660,
-                                0.1349,
-                                0.0159,
-                                0.4649,
-                                0.3712,
-                            ]
-                        ],
+                        0.3408,
+                        0.1985,
+                        0.2097,
+                        0.4764,
+                        0.0926,
+                        0.1526,
+                        0.0880,
+                        0.0753,
+                        0.1041,
+                        0.3616,
                     ]
-                ]
-            )
-        )
+                ],
+            ]
+        ]
+    )
+    w_i = jnp.array(
+        [
+            [
+                [
+                    [
+                        0.3841,
+                        0.0660,
+                        0.3170,
+                        0.4482,
+                        0.3162,
+                        0.2009,
+                        0.0844,
+                        0.2593,
+                        0.4000,
+                        0.1411,
+                    ]
+                ],
+                [
+                    [
+                        0.4576,
+                        0.4371,
+                        0.2765,
+                        0.0181,
+                        0.1867,
+                        0.4660,
+                        0.1349,
+                        0.0159,
+                        0.4649,
+                        0.3712,
+                    ]
+                ],
+            ]
+        ]
     )
+    layer = layer.at["weight"].set(jnp.stack([w_r, w_i]))
     x = jnp.array(
         [
             [
@@ -1604,7 +1597,7 @@ def test_spectral_conv_2d():
         ]
     )
 
-    layer_ = layer_.at["weight_r"].set(w_r).at["weight_i"].set(w_i)
+    layer_ = layer_.at["weight"].set(jnp.stack([w_r, w_i]))
     x = jnp.array(
         [
             [
@@ -1797,7 +1790,7 @@ def test_spectral_conv_3d():
     )
 
     layer_ = sk.nn.SpectralConv3D(1, 2, modes=(3, 2, 3), key=jax.random.key(0))
-    layer_ = layer_.at["weight_r"].set(w_r).at["weight_i"].set(w_i)
+    layer_ = layer_.at["weight"].set(jnp.stack([w_r, w_i]))
     x_ = jnp.array(
         [
             [
@@ -1942,3 +1935,98 @@ def test_spectral_conv_3d():
         ),
         atol=1e-6,
     )
+
+
+@pytest.mark.parametrize(
+    "layer_type,ndim",
+    [(sk.nn.SpectralConv1D, 1), (sk.nn.SpectralConv2D, 2), (sk.nn.SpectralConv3D, 3)],
+)
+def test_spectral_conv_weight_shape(layer_type, ndim):
+    layer = layer_type(2, 3, modes=2, key=jax.random.key(0))
+    assert layer.weight.shape == (2, 2 ** (ndim - 1), 3, 2, *(2,) * ndim)
+
+
+def test_spectral_conv_nd_complex_weight():
+    layer = sk.nn.SpectralConv2D(2, 3, modes=(2, 3), key=jax.random.key(0))
+    x = jax.random.normal(jax.random.key(1), (2, 8, 8))
+    complex_weight = layer.weight[0] + 1j * layer.weight[1]
+    npt.assert_allclose(
+        sk.nn.spectral_conv_nd(x, complex_weight, layer.modes),
+        layer(x),
+        atol=1e-6,
+    )
+    npt.assert_allclose(
+        sk.nn.spectral_conv_nd(x, layer.weight, [2, 3]),
+        layer(x),
+        atol=1e-6,
+    )
+
+
+def test_spectral_conv_bfloat16():
+    layer = sk.nn.SpectralConv1D(2, 3, modes=4, key=jax.random.key(0))
+    layer_bf16 = sk.nn.SpectralConv1D(
+        2, 3, modes=4, key=jax.random.key(0), dtype=jnp.bfloat16
+    )
+    x = jax.random.normal(jax.random.key(1), (2, 16))
+    assert layer_bf16.weight.dtype == jnp.bfloat16
+    assert layer_bf16(x.astype(jnp.bfloat16)).dtype == jnp.bfloat16
+    npt.assert_allclose(layer_bf16(x), layer(x), atol=1e-2)
+
+
+def test_spectral_conv_integer_input():
+    layer = sk.nn.SpectralConv1D(1, 1, modes=3, key=jax.random.key(0))
+    x = jnp.arange(8)[None]
+    y = layer(x)
+    assert y.dtype == jnp.float32
+    npt.assert_allclose(y, layer(x.astype(jnp.float32)), atol=1e-6)
+
+
+def test_spectral_conv_mask():
+    layer = sk.nn.SpectralConv2D(2, 3, modes=(2, 3), key=jax.random.key(0))
+    x = jax.random.normal(jax.random.key(1), (2, 8, 8))
+    mask = jnp.ones(layer.weight.shape[1:])
+    npt.assert_allclose(layer(x, mask=mask), layer(x), atol=1e-6)
+    npt.assert_allclose(layer(x, mask=jnp.zeros_like(mask)), 0.0, atol=1e-6)
+    # masked kernel is equivalent to a zeroed kernel
+    mask = mask.at[0].set(0.0)
+    npt.assert_allclose(
+        layer(x, mask=mask),
+        layer.at["weight"].set(layer.weight * mask)(x),
+        atol=1e-6,
+    )
+
+
+def test_spectral_conv_modes_exceed_spectrum():
+    layer = sk.nn.SpectralConv2D(1, 1, modes=(2, 6), key=jax.random.key(0))
+    # rfft spectrum of the last axis has 8 // 2 + 1 = 5 modes
+    with pytest.raises(ValueError):
+        layer(jnp.ones((1, 8, 8)))
+    layer = sk.nn.SpectralConv2D(1, 1, modes=(9, 2), key=jax.random.key(0))
+    with pytest.raises(ValueError):
+        layer(jnp.ones((1, 8, 8)))
+
+
+@pytest.mark.parametrize("in_features,out_features", [(1, 3), (2, 3)])
+def test_spectral_conv_corners_mismatch(in_features, out_features):
+    layer = sk.nn.SpectralConv2D(
+        in_features, out_features, modes=(2, 3), key=jax.random.key(0)
+    )
+    # a 2D layer needs 2 corners, a 1D weight has a single corner
+    layer = layer.at["weight"].set(layer.weight[:, :1])
+    with pytest.raises(ValueError):
+        layer(jnp.ones((in_features, 8, 8)))
+
+
+@pytest.mark.parametrize("in_features,out_features", [(1, 3), (3, 1), (1, 1), (2, 3)])
+def test_spectral_conv_nd_features(in_features, out_features):
+    layer = sk.nn.SpectralConv2D(
+        in_features, out_features, modes=(2, 3), key=jax.random.key(0)
+    )
+    x = jax.random.normal(jax.random.key(1), (in_features, 8, 8))
+    weight = layer.weight[0] + 1j * layer.weight[1]
+    x_fft = jnp.fft.rfftn(x, axes=(1, 2))
+    out = jnp.zeros((out_features, 8, 5), dtype=x_fft.dtype)
+    low = jnp.einsum("ixy,oixy->oxy", x_fft[:, :2, :3], weight[0])
+    high = jnp.einsum("ixy,oixy->oxy", x_fft[:, -2:, :3], weight[1])
+    out = out.at[:, :2, :3].set(low).at[:, -2:, :3].set(high)
+    npt.assert_allclose(layer(x), jnp.fft.irfftn(out, s=(8, 8)), atol=1e-6)
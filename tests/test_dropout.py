@@ -28,6 +28,9 @@ def test_dropout():
         layer(x, key=jax.random.key(0)), jnp.array([0.0, 0.0, 0.0, 0.0, 0.0])
     )
 
+    grad = jax.grad(lambda x: layer(x, key=jax.random.key(0)).sum())(x * 1.0)
+    npt.assert_allclose(grad, jnp.zeros(5))
+
     layer = layer.at["drop_rate"].set(0.0)
     npt.assert_allclose(layer(x, key=jax.random.key(0)), x)
 
@@ -38,6 +41,24 @@ def test_dropout():
         sk.nn.Dropout(-0.1)
 
 
+@pytest.mark.parametrize("dtype", [jnp.bfloat16, jnp.float16, jnp.float32])
+def test_dropout_dtype(dtype):
+    x = jnp.ones((4, 10), dtype=dtype)
+    y = sk.nn.Dropout(0.5)(x, key=jax.random.key(0))
+    assert y.dtype == dtype
+    assert set(jnp.unique(y).tolist()) <= {0.0, 2.0}
+
+
+def test_dropout_list_args():
+    x = jnp.ones((4, 10))
+    key = jax.random.key(0)
+    y = sk.nn.Dropout(0.5, drop_axes=[0])(x, key=key)
+    npt.assert_array_equal(y, sk.nn.Dropout(0.5, drop_axes=(0,))(x, key=key))
+    npt.assert_array_equal(sk.nn.dropout_nd(key, x, 0.5, [0]), y)
+    y = sk.nn.random_cutout_nd(key, x, [2, 2], 1, 0.0)
+    npt.assert_array_equal(y, sk.nn.random_cutout_nd(key, x, (2, 2), 1, 0.0))
+
+
 def test_random_cutout_1d():
     layer = sk.nn.RandomCutout1D(3, 1)
     x = jnp.ones((1, 10))
@@ -52,6 +73,19 @@ def test_random_cutout_2d():
     npt.assert_equal(y.shape, (1, 10, 10))
 
 
+def test_random_cutout_2d_fill():
+    layer = sk.nn.RandomCutout2D((3, 2), 4, fill_value=-1)
+    x = jnp.ones((2, 10, 10))
+    y = layer(x, key=jax.random.key(0))
+    # same cutouts for all channels
+    npt.assert_array_equal(y[0], y[1])
+    # distinct non-overlapping cutouts within the (9, 10) grid region
+    assert jnp.sum(y[0] == -1) == 4 * 3 * 2
+    assert jnp.all(y[0, 9:] == 1)
+    patches = (y[0, :9] == -1).reshape(3, 3, 5, 2)
+    assert jnp.all(patches.all(axis=(1, 3)) == patches.any(axis=(1, 3)))
+
+
 def test_random_cutout_3d():
     layer = sk.nn.RandomCutout3D((3, 3, 3), 1)
     x = jnp.ones((1, 10, 10, 10))
@@ -14,15 +14,17 @@
 
 import os
 
+os.environ["KERAS_BACKEND"] = "jax"
+import math
+
 import jax
 import jax.numpy as jnp
 import numpy.testing as npt
 import pytest
+from keras.layers import BatchNormalization
 
 import serket as sk
 
-os.environ["KERAS_BACKEND"] = "jax"
-
 
 def test_layer_norm():
     layer = sk.nn.LayerNorm(
@@ -224,10 +226,6 @@ def test_group_norm():
     [[0, None], [1, "foo"], [2, "bar"], [3, "baz"]],
 )
 def test_batchnorm(axis, axis_name):
-    import math
-
-    from keras.layers import BatchNormalization
-
     mat_jax = lambda n: jnp.arange(1, math.prod(n) + 1).reshape(*n).astype(jnp.float32)
 
     x_keras = mat_jax((5, 10, 7, 8))
@@ -260,8 +258,9 @@ def test_batchnorm(axis, axis_name):
     kwargs = dict(axis_name=axis_name, in_axes=in_axes, out_axes=out_axes)
     if axis_name is None:
         kwargs.pop("axis_name")
+    train_step = jax.jit(jax.vmap(bn_sk, **kwargs))
     for _ in range(5):
-        x_sk, state = jax.vmap(bn_sk, **kwargs)(x_sk, state)
+        x_sk, state = train_step(x_sk, state)
 
     npt.assert_allclose(x_keras, x_sk, atol=1e-5)
     npt.assert_allclose(bn_keras.moving_mean, state.running_mean, atol=1e-5)
@@ -269,7 +268,8 @@ def test_batchnorm(axis, axis_name):
     x_keras = bn_keras(x_keras, training=False)
     bn_sk_eval = sk.tree_eval(bn_sk)
     in_axes = (0, None)
-    x_sk, _ = jax.vmap(bn_sk_eval, in_axes, axis_name=axis_name)(x_sk, state)
+    eval_step = jax.jit(jax.vmap(bn_sk_eval, in_axes, axis_name=axis_name))
+    x_sk, _ = eval_step(x_sk, state)
     npt.assert_allclose(x_keras, x_sk, rtol=1e-4)
 
 
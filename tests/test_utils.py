@@ -45,6 +45,7 @@ from serket._src.utils.validate import IsInstance, ScalarLike, validate_pos_int
         "zeros",
         "xavier_normal",
         "xavier_uniform",
+        "orthogonal",
     ],
 )
 def test_canonicalize_init_string(init_name):
@@ -56,6 +57,8 @@ def test_canonicalize_init_func():
     assert isinstance(resolve_init(jax.nn.initializers.he_normal()), jtu.Partial)
     assert isinstance(resolve_init(None), jtu.Partial)
 
+    assert resolve_init("he_normal") is resolve_init("he_normal")
+
     with pytest.raises(ValueError):
         resolve_init("invalid")
 
@@ -67,6 +70,7 @@ def test_canonicalize():
     assert canonicalize(3, 2) == (3, 3)
     assert canonicalize((3, 3), 2) == (3, 3)
     assert canonicalize((3, 3, 3), 3) == (3, 3, 3)
+    assert canonicalize([3, 3], 2) == (3, 3)
 
     with pytest.raises(ValueError):
         canonicalize((3, 3), 3)